@@ -0,0 +1,75 @@
+import gzip
+import json
+import os
+from decimal import Decimal
+import boto3
+from boto3.dynamodb.types import TypeDeserializer
+
+# Environment variables
+bucket_name = os.environ['ARCHIVE_BUCKET_NAME']
+region = os.environ.get('AWS_REGION', 'us-east-1')
+
+# Initialize S3 client and DynamoDB stream image deserializer
+s3 = boto3.client('s3', region_name=region)
+deserializer = TypeDeserializer()
+
+
+# Helper class to convert DynamoDB Decimal types to JSON
+class DecimalEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return int(obj) if obj % 1 == 0 else float(obj)
+        return super(DecimalEncoder, self).default(obj)
+
+
+def lambda_handler(event, context):
+    """
+    Lambda function handler to archive expired adoption applications to S3.
+
+    This function is invoked by the Applications table DynamoDB Stream. The
+    event source mapping only forwards REMOVE records issued by the DynamoDB
+    TTL service, so every record here is an application whose `expires_at`
+    has passed. Each old image is written as its own gzip-compressed NDJSON
+    object, partitioned by the month the application was submitted:
+
+        applications/month=YYYY-MM/<applicationId>.ndjson.gz
+
+    Keying by applicationId makes every write idempotent: a retried batch,
+    including the half-batches produced by bisection, overwrites the objects
+    it already wrote instead of archiving an application twice.
+    Failures are re-raised so Lambda retries, and the event source mapping
+    bisects failing batches. TTL deletes cannot be undone, so a batch that
+    exhausts its retries is lost unless an operator acts: the on-failure
+    message in ArchiveApplicationsFailures only holds shard and sequence-number
+    pointers, which can be read back from the stream for its 24h retention.
+    The queue-depth alarm notifies OperationalAlarmsTopic when that happens.
+
+    Args:
+        event: DynamoDB Stream event containing a batch of records
+        context: Lambda context object with runtime information
+
+    Returns:
+        dict: Number of applications archived
+    """
+
+    archived = 0
+    for record in event.get('Records', []):
+        old_image = record.get('dynamodb', {}).get('OldImage')
+        if not old_image:
+            continue
+
+        application = {key: deserializer.deserialize(value) for key, value in old_image.items()}
+        month = application.get('submitted_at', '')[:7] or 'unknown'
+        key = f"applications/month={month}/{application['applicationId']}.ndjson.gz"
+
+        s3.put_object(
+            Bucket=bucket_name,
+            Key=key,
+            Body=gzip.compress((json.dumps(application, cls=DecimalEncoder) + '\n').encode('utf-8')),
+            ContentType='application/x-ndjson',
+            ContentEncoding='gzip'
+        )
+        archived += 1
+
+    print(f"Archived {archived} applications to s3://{bucket_name}/applications/")
+    return {'archived': archived}
@@ -0,0 +1,116 @@
+import os
+import time
+from datetime import datetime
+import boto3
+from boto3.dynamodb.types import TypeDeserializer
+
+# Environment variables
+versions_table_name = os.environ.get('TABLE_VERSIONS_TABLE_NAME', 'TableVersions')
+tombstones_table_name = os.environ.get('TOMBSTONES_TABLE_NAME', 'Tombstones')
+region = os.environ.get('AWS_REGION', 'us-east-1')
+tombstone_retention_days = int(os.environ.get('TOMBSTONE_RETENTION_DAYS', '30'))
+
+# Map DynamoDB table names to their version attribute prefix and record type
+table_keys = {
+    os.environ.get('PETS_TABLE', 'Pets'): ('pets', 'pet'),
+    os.environ.get('APPLICATIONS_TABLE_NAME', 'Applications'): ('applications', 'application'),
+    os.environ.get('ADOPTIONS_TABLE', 'AdoptionsTable'): ('adoptions', 'adoption')
+}
+
+# Initialize DynamoDB resource and stream key deserializer
+dynamodb = boto3.resource('dynamodb', region_name=region)
+versions_table = dynamodb.Table(versions_table_name)
+tombstones_table = dynamodb.Table(tombstones_table_name)
+deserializer = TypeDeserializer()
+
+
+def lambda_handler(event, context):
+    """
+    Lambda function handler to bump table versions and record deletes from DynamoDB Streams.
+
+    This is the only writer of the TableVersions item. Every change to the
+    Pets, Applications and Adoptions tables, whether made by the API, the
+    seeding scripts, console edits or TTL deletions, reaches it through the
+    table streams.
+
+    A batch bumps each affected table's version once, no matter how many
+    records it holds. Each REMOVE record also writes a tombstone to the
+    Tombstones table, so `?changed_since=` delta syncs can report deletes.
+    Tombstones expire after TOMBSTONE_RETENTION_DAYS.
+
+    `deleted_at` is the record's ApproximateCreationDateTime, i.e. when the
+    delete happened. The `tombstone_id` sort key that delta syncs compare
+    against the watermark is instead stamped just before the tombstones are
+    written: a stream delay or retry then cannot place a tombstone behind a
+    watermark that was already handed out. This is only safe while the
+    tombstone write itself completes within SYNC_LAG_SECONDS of that stamp,
+    which is the lag every delta-sync watermark is held back by.
+
+    MODIFY records only bump the version. Delta syncs read `updated_at`,
+    which this function cannot stamp without re-triggering the stream, so a
+    writer outside the API must set it itself for its edits to be synced.
+
+    Failures are re-raised so Lambda retries; the event source mappings bisect
+    failing batches and, after 5 retries, send the batch pointers to the
+    BumpTableVersionFailures queue, whose alarm notifies OperationalAlarmsTopic.
+    Retries can bump a version more than once, which clients only see as an
+    extra re-fetch.
+
+    Args:
+        event: DynamoDB Stream event containing a batch of records
+        context: Lambda context object with runtime information
+
+    Returns:
+        dict: Tables whose version was bumped and number of tombstones written
+    """
+
+    # eventSourceARN looks like arn:aws:dynamodb:<region>:<account>:table/<name>/stream/<label>
+    changed = set()
+    removed = []
+    for record in event.get('Records', []):
+        source_table = record['eventSourceARN'].split(':table/')[1].split('/')[0]
+        if source_table not in table_keys:
+            continue
+
+        version_key, record_type = table_keys[source_table]
+        changed.add(version_key)
+
+        if record['eventName'] == 'REMOVE':
+            key = {name: deserializer.deserialize(value) for name, value in record['dynamodb']['Keys'].items()}
+            deleted_at = datetime.utcfromtimestamp(record['dynamodb']['ApproximateCreationDateTime']).isoformat()
+            removed.append((record_type, key, deleted_at))
+
+    # Stamp the sort key as late as possible, right before the write
+    written_at = datetime.utcnow().isoformat()
+    expires_at = int(time.time()) + tombstone_retention_days * 24 * 60 * 60
+    tombstones = [
+        {
+            'record_type': record_type,
+            'tombstone_id': f"{written_at}#{'#'.join(str(value) for value in key.values())}",
+            'key': key,
+            'deleted_at': deleted_at,
+            'expires_at': expires_at
+        }
+        for record_type, key, deleted_at in removed
+    ]
+
+    # Write tombstones before bumping versions so a client that sees the new
+    # version can always find the matching delete
+    with tombstones_table.batch_writer() as batch:
+        for tombstone in tombstones:
+            batch.put_item(Item=tombstone)
+
+    now = datetime.utcnow().isoformat()
+    for key in sorted(changed):
+        versions_table.update_item(
+            Key={'id': 'tables'},
+            UpdateExpression='ADD #version :one SET #updated_at = :now',
+            ExpressionAttributeNames={
+                '#version': f'{key}_version',
+                '#updated_at': f'{key}_updated_at'
+            },
+            ExpressionAttributeValues={':one': 1, ':now': now}
+        )
+        print(f"Bumped {key} version")
+
+    return {'bumped': sorted(changed), 'tombstones': len(tombstones)}
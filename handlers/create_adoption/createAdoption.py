@@ -2,6 +2,7 @@ import json
 import boto3
 import os
 import uuid
+from datetime import datetime
 
 def lambda_handler(event, context):
     # Create response dictionary
@@ -25,8 +26,10 @@ def lambda_handler(event, context):
         # Generate a unique id and add it to the body
         body['id'] = str(uuid.uuid4())
         
-        # Insert the body into the table
-        table.put_item(Item=body)
+        # Insert the body into the table; the UpdatedAtIndex keys are only
+        # stored, not echoed back to the client
+        updated_at = datetime.utcnow().isoformat()
+        table.put_item(Item=dict(body, record_type='adoption', updated_at=updated_at))
         
         # Set response body with the created data
         response['body'] = json.dumps(body)
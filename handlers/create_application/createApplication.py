@@ -1,5 +1,6 @@
 import json
 import os
+import time
 import uuid
 from datetime import datetime
 import boto3
@@ -8,6 +9,7 @@ from botocore.exceptions import ClientError
 # Environment variables
 table_name = os.environ.get('APPLICATIONS_TABLE_NAME', 'Applications')
 region = os.environ.get('AWS_REGION', 'us-east-1')
+retention_days = int(os.environ.get('APPLICATION_RETENTION_DAYS', '180'))
 
 # Initialize DynamoDB resource
 dynamodb = boto3.resource('dynamodb', region_name=region)
@@ -22,6 +24,15 @@ def lambda_handler(event, context):
     It validates the input, generates a unique ID, adds a timestamp, and stores
     the application in the Applications DynamoDB table.
 
+    Every application is stamped with an `expires_at` TTL attribute. Once it
+    passes, DynamoDB deletes the item and the archiveApplications stream
+    consumer moves it to the S3 archive, so the live table only holds
+    applications from the retention window.
+
+    The `applications` version read by GET /version is bumped from the table
+    stream by bumpTableVersion, not here, so a created application is never
+    reported as a failure.
+
     Args:
         event: API Gateway event object containing request details and body
         context: Lambda context object with runtime information
@@ -60,6 +71,9 @@ def lambda_handler(event, context):
         application_id = str(uuid.uuid4())
         submitted_at = datetime.utcnow().isoformat()
 
+        # TTL attribute must be epoch seconds for DynamoDB to honour it
+        expires_at = int(time.time()) + retention_days * 24 * 60 * 60
+
         # Construct the application item
         application = {
             'applicationId': application_id,
@@ -71,11 +85,12 @@ def lambda_handler(event, context):
             'email': body['email'],
             'phone': body['phone'],
             'submitted_at': submitted_at,
-            'status': 'pending'  # Default status
+            'status': 'pending',  # Default status
+            'expires_at': expires_at
         }
 
-        # Store in DynamoDB
-        table.put_item(Item=application)
+        # Store in DynamoDB, adding the UpdatedAtIndex keys to the stored copy only
+        table.put_item(Item={**application, 'record_type': 'application', 'updated_at': submitted_at})
 
         # Return successful response with created application
         return {
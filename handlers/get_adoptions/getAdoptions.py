@@ -1,30 +1,119 @@
 import boto3
 import os
 import json
+from datetime import datetime, timedelta, timezone
+from boto3.dynamodb.conditions import Key
+
+# Environment variables
+tombstones_table_name = os.environ.get('TOMBSTONES_TABLE_NAME', 'Tombstones')
+sync_lag_seconds = int(os.environ.get('SYNC_LAG_SECONDS', '5'))
+tombstone_retention_days = int(os.environ.get('TOMBSTONE_RETENTION_DAYS', '30'))
+
+# Connect to the DynamoDB tables
+dynamodb = boto3.resource('dynamodb')
+table = dynamodb.Table(os.environ['APPLICATIONS_TABLE_NAME'])
+tombstones_table = dynamodb.Table(tombstones_table_name)
+
+# Attributes kept for DynamoDB bookkeeping only, never returned to clients
+internal_attributes = ('record_type', 'updated_at', 'expires_at')
+
+def strip_internal_attributes(items):
+    # record_type/updated_at are index keys, not part of the public record
+    return [{key: value for key, value in item.items() if key not in internal_attributes} for item in items]
+
+def query_all(query_table, **kwargs):
+    # Follow LastEvaluatedKey until every page of the query has been read
+    response = query_table.query(**kwargs)
+    items = response.get('Items', [])
+    while 'LastEvaluatedKey' in response:
+        response = query_table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **kwargs)
+        items.extend(response.get('Items', []))
+    return items
+
+def parse_changed_since(value):
+    # updated_at is stored as naive UTC, so drop any offset after converting
+    since = datetime.fromisoformat(value)
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    return since
+
+def get_changed_adoptions(since):
+    # Inserts/updates from the UpdatedAtIndex GSI, deletes from Tombstones
+    started_at = datetime.utcnow()
+    since_iso = since.isoformat()
+
+    changed = query_all(
+        table,
+        IndexName='UpdatedAtIndex',
+        KeyConditionExpression=Key('record_type').eq('adoption') & Key('updated_at').gte(since_iso)
+    )
+    tombstones = query_all(
+        tombstones_table,
+        KeyConditionExpression=Key('record_type').eq('adoption') & Key('tombstone_id').gte(since_iso)
+    )
+    deleted = [dict(tombstone['key'], deleted_at=tombstone['deleted_at']) for tombstone in tombstones]
+
+    watermark = max(since_iso, (started_at - timedelta(seconds=sync_lag_seconds)).isoformat())
+    return changed, deleted, watermark
 
 def lambda_handler(event, context):
+    headers = {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, HEAD, OPTIONS',
+        'Access-Control-Allow-Headers': 'Origin, X-Requested-With, Content-Type, Accept'
+    }
+
     try:
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table(os.environ['APPLICATIONS_TABLE_NAME'])
+        query_params = event.get('queryStringParameters') or {}
+
+        # With ?changed_since= only return adoptions changed since the client's watermark
+        if query_params.get('changed_since'):
+            try:
+                since = parse_changed_since(query_params['changed_since'])
+            except ValueError:
+                return {
+                    'statusCode': 400,
+                    'headers': headers,
+                    'body': json.dumps({'error': 'changed_since must be an ISO 8601 timestamp'})
+                }
+
+            if since < datetime.utcnow() - timedelta(days=tombstone_retention_days):
+                return {
+                    'statusCode': 410,
+                    'headers': headers,
+                    'body': json.dumps({'error': 'changed_since is older than the tombstone retention - reload the full list'})
+                }
+
+            items, deleted, watermark = get_changed_adoptions(since)
+
+            response_body = {
+                'message': 'Successfully got adoption changes',
+                'adoptions': strip_internal_attributes(items),
+                'deleted': deleted,
+                'count': len(items),
+                'watermark': watermark
+            }
+            return {
+                'statusCode': 200,
+                'headers': headers,
+                'body': json.dumps(response_body)
+            }
+
         items = table.scan()['Items']
-        
+
         response_body = {
             'message': 'Successfully got adoptions',
-            'adoptions': items,
+            'adoptions': strip_internal_attributes(items),
             'count': len(items)
         }
-        
+
         response = {
             'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'GET, HEAD, OPTIONS',
-                'Access-Control-Allow-Headers': 'Origin, X-Requested-With, Content-Type, Accept'
-            },
+            'headers': headers,
             'body': json.dumps(response_body)
         }
         return response
-        
+
     except Exception as e:
         return {
             'statusCode': 500,
@@ -33,4 +122,4 @@ def lambda_handler(event, context):
             },
             'body': json.dumps({'error': str(e)})
         }
-    
\ No newline at end of file
+
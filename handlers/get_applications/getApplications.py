@@ -1,15 +1,164 @@
+import gzip
 import json
 import os
+import re
 import boto3
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
 # Environment variables
 table_name = os.environ.get('APPLICATIONS_TABLE_NAME', 'Applications')
 region = os.environ.get('AWS_REGION', 'us-east-1')
+archive_bucket_name = os.environ.get('ARCHIVE_BUCKET_NAME', '')
+archive_page_size = int(os.environ.get('ARCHIVE_PAGE_SIZE', '100'))
+tombstones_table_name = os.environ.get('TOMBSTONES_TABLE_NAME', 'Tombstones')
+sync_lag_seconds = int(os.environ.get('SYNC_LAG_SECONDS', '5'))
+tombstone_retention_days = int(os.environ.get('TOMBSTONE_RETENTION_DAYS', '30'))
 
-# Initialize DynamoDB resource
+# Initialize DynamoDB resource and S3 client
 dynamodb = boto3.resource('dynamodb', region_name=region)
 table = dynamodb.Table(table_name)
+tombstones_table = dynamodb.Table(tombstones_table_name)
+s3 = boto3.client('s3', region_name=region)
+
+# Attributes kept for DynamoDB bookkeeping only, never returned to clients
+internal_attributes = ('record_type', 'updated_at', 'expires_at')
+
+
+# Helper class to convert DynamoDB Decimal types to JSON
+class DecimalEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return int(obj) if obj % 1 == 0 else float(obj)
+        return super(DecimalEncoder, self).default(obj)
+
+
+def strip_internal_attributes(items):
+    """
+    Drop index and lifecycle bookkeeping from items before they are returned.
+
+    `record_type` and `updated_at` are UpdatedAtIndex keys and `expires_at` is
+    the TTL attribute; none of them are part of the public record.
+
+    Args:
+        items: DynamoDB items
+
+    Returns:
+        list: Items without internal attributes
+    """
+    return [{key: value for key, value in item.items() if key not in internal_attributes} for item in items]
+
+
+def get_archived_applications(month, next_token=None):
+    """
+    Read one page of archived applications from the S3 archive bucket.
+
+    archiveApplications writes each expired application as its own
+    gzip-compressed NDJSON object keyed by applicationId, so the archive holds
+    no duplicates. Each call reads at most ARCHIVE_PAGE_SIZE objects from a
+    single month partition, so the cost of a request does not grow with the
+    size of the archive.
+
+    Args:
+        month: Submission month partition to read (YYYY-MM)
+        next_token: S3 continuation token returned by the previous page
+
+    Returns:
+        tuple: (archived application records, token for the next page or None)
+    """
+    list_kwargs = {
+        'Bucket': archive_bucket_name,
+        'Prefix': f"applications/month={month}/",
+        'MaxKeys': archive_page_size
+    }
+    if next_token:
+        list_kwargs['ContinuationToken'] = next_token
+
+    page = s3.list_objects_v2(**list_kwargs)
+
+    applications = []
+    for obj in page.get('Contents', []):
+        body = s3.get_object(Bucket=archive_bucket_name, Key=obj['Key'])['Body'].read()
+        for line in gzip.decompress(body).decode('utf-8').splitlines():
+            if line:
+                applications.append(json.loads(line))
+
+    return applications, page.get('NextContinuationToken')
+
+
+def query_all(query_table, **kwargs):
+    """
+    Run a DynamoDB query and follow LastEvaluatedKey until every page is read.
+
+    Args:
+        query_table: DynamoDB Table resource to query
+        **kwargs: Arguments passed to Table.query
+
+    Returns:
+        list: All items matching the query
+    """
+    response = query_table.query(**kwargs)
+    items = response.get('Items', [])
+    while 'LastEvaluatedKey' in response:
+        response = query_table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **kwargs)
+        items.extend(response.get('Items', []))
+    return items
+
+
+def parse_changed_since(value):
+    """
+    Parse a `changed_since` watermark into the naive UTC form used by `updated_at`.
+
+    Args:
+        value: ISO 8601 timestamp, with or without a UTC offset
+
+    Returns:
+        datetime: Naive UTC datetime
+
+    Raises:
+        ValueError: If the value is not an ISO 8601 timestamp
+    """
+    since = datetime.fromisoformat(value)
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    return since
+
+
+def get_changed_applications(since):
+    """
+    Return the applications inserted, updated or deleted since a client watermark.
+
+    Inserts and updates come from the UpdatedAtIndex GSI (record_type +
+    updated_at) and deletes from the Tombstones table, whose sort key
+    `<written_at>#<key>` orders tombstones by write time. The cost therefore
+    scales with the number of changes rather than the table size. The new
+    watermark trails the current time by SYNC_LAG_SECONDS to cover GSI
+    propagation and clock skew; clients may see a record twice and should upsert.
+
+    Args:
+        since: Naive UTC datetime of the client's last watermark
+
+    Returns:
+        tuple: (changed applications, deleted application keys, new watermark)
+    """
+    started_at = datetime.utcnow()
+    since_iso = since.isoformat()
+
+    changed = query_all(
+        table,
+        IndexName='UpdatedAtIndex',
+        KeyConditionExpression=Key('record_type').eq('application') & Key('updated_at').gte(since_iso)
+    )
+    tombstones = query_all(
+        tombstones_table,
+        KeyConditionExpression=Key('record_type').eq('application') & Key('tombstone_id').gte(since_iso)
+    )
+    deleted = [dict(tombstone['key'], deleted_at=tombstone['deleted_at']) for tombstone in tombstones]
+
+    watermark = max(since_iso, (started_at - timedelta(seconds=sync_lag_seconds)).isoformat())
+    return changed, deleted, watermark
 
 
 def lambda_handler(event, context):
@@ -18,6 +167,11 @@ def lambda_handler(event, context):
 
     This function is invoked by API Gateway when a GET request is made to /applications.
     It scans the Applications DynamoDB table and returns all application records.
+    With `?archived=true&month=YYYY-MM` it reads one page of expired
+    applications for that submission month from the S3 archive instead; pass
+    the returned `next_token` back to fetch the following page.
+    With `?changed_since=<ISO timestamp>` it only returns the applications that
+    changed since that watermark, plus tombstones for deleted ones.
 
     Args:
         event: API Gateway event object containing request details
@@ -36,6 +190,70 @@ def lambda_handler(event, context):
     }
 
     try:
+        query_params = event.get('queryStringParameters') or {}
+
+        # Serve expired applications from the S3 archive
+        if query_params.get('archived', '').lower() == 'true':
+            month = query_params.get('month', '')
+            if not re.match(r'^\d{4}-\d{2}$', month):
+                return {
+                    'statusCode': 400,
+                    'headers': headers,
+                    'body': json.dumps({
+                        'message': 'Bad request - archived reads require month=YYYY-MM'
+                    })
+                }
+
+            applications, next_token = get_archived_applications(month, query_params.get('next_token'))
+
+            return {
+                'statusCode': 200,
+                'headers': headers,
+                'body': json.dumps({
+                    'message': 'Successfully got archived applications',
+                    'applications': strip_internal_attributes(applications),
+                    'count': len(applications),
+                    'next_token': next_token
+                })
+            }
+
+        # Serve only the changes since the client's watermark
+        if query_params.get('changed_since'):
+            try:
+                since = parse_changed_since(query_params['changed_since'])
+            except ValueError:
+                return {
+                    'statusCode': 400,
+                    'headers': headers,
+                    'body': json.dumps({
+                        'message': 'Bad request - changed_since must be an ISO 8601 timestamp'
+                    })
+                }
+
+            # Tombstones have expired for anything older, so deletes would be missed
+            if since < datetime.utcnow() - timedelta(days=tombstone_retention_days):
+                return {
+                    'statusCode': 410,
+                    'headers': headers,
+                    'body': json.dumps({
+                        'message': 'changed_since is older than the tombstone retention - reload the full list'
+                    })
+                }
+
+            applications, deleted, watermark = get_changed_applications(since)
+
+            return {
+                'statusCode': 200,
+                'headers': headers,
+                'body': json.dumps({
+                    'message': 'Successfully got application changes',
+                    'applications': strip_internal_attributes(applications),
+                    'deleted': deleted,
+                    'count': len(applications),
+                    'watermark': watermark
+                }, cls=DecimalEncoder)
+            }
+
         # Scan the DynamoDB table to get all applications
         response = table.scan()
         applications = response.get('Items', [])
@@ -52,9 +270,9 @@ def lambda_handler(event, context):
             'headers': headers,
             'body': json.dumps({
                 'message': 'Successfully got applications',
-                'applications': applications,
+                'applications': strip_internal_attributes(applications),
                 'count': len(applications)
-            })
+            }, cls=DecimalEncoder)
         }
 
     except ClientError as e:
@@ -1,16 +1,25 @@
 import json
 import os
 import boto3
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
 # Environment variables - matches class curriculum
 table_name = os.environ['PETS_TABLE']
 region = os.environ.get('AWS_REGION', 'us-east-1')
+tombstones_table_name = os.environ.get('TOMBSTONES_TABLE_NAME', 'Tombstones')
+sync_lag_seconds = int(os.environ.get('SYNC_LAG_SECONDS', '5'))
+tombstone_retention_days = int(os.environ.get('TOMBSTONE_RETENTION_DAYS', '30'))
 
 # Initialize DynamoDB resource
 dynamodb = boto3.resource('dynamodb', region_name=region)
 table = dynamodb.Table(table_name)
+tombstones_table = dynamodb.Table(tombstones_table_name)
+
+# Attributes kept for DynamoDB bookkeeping only, never returned to clients
+internal_attributes = ('record_type', 'updated_at', 'expires_at')
 
 
 # Helper class to convert DynamoDB Decimal types to JSON
@@ -21,12 +30,100 @@ class DecimalEncoder(json.JSONEncoder):
         return super(DecimalEncoder, self).default(obj)
 
 
+def strip_internal_attributes(items):
+    """
+    Drop index and lifecycle bookkeeping from items before they are returned.
+
+    `record_type` and `updated_at` are UpdatedAtIndex keys and `expires_at` is
+    the TTL attribute; none of them are part of the public record.
+
+    Args:
+        items: DynamoDB items
+
+    Returns:
+        list: Items without internal attributes
+    """
+    return [{key: value for key, value in item.items() if key not in internal_attributes} for item in items]
+
+
+def query_all(query_table, **kwargs):
+    """
+    Run a DynamoDB query and follow LastEvaluatedKey until every page is read.
+
+    Args:
+        query_table: DynamoDB Table resource to query
+        **kwargs: Arguments passed to Table.query
+
+    Returns:
+        list: All items matching the query
+    """
+    response = query_table.query(**kwargs)
+    items = response.get('Items', [])
+    while 'LastEvaluatedKey' in response:
+        response = query_table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **kwargs)
+        items.extend(response.get('Items', []))
+    return items
+
+
+def parse_changed_since(value):
+    """
+    Parse a `changed_since` watermark into the naive UTC form used by `updated_at`.
+
+    Args:
+        value: ISO 8601 timestamp, with or without a UTC offset
+
+    Returns:
+        datetime: Naive UTC datetime
+
+    Raises:
+        ValueError: If the value is not an ISO 8601 timestamp
+    """
+    since = datetime.fromisoformat(value)
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    return since
+
+
+def get_changed_pets(since):
+    """
+    Return the pets inserted, updated or deleted since a client watermark.
+
+    Reads the UpdatedAtIndex GSI for inserts and updates and the Tombstones
+    table for deletes. The watermark lags by SYNC_LAG_SECONDS, so a pet may
+    be returned twice.
+
+    Args:
+        since: Naive UTC datetime of the client's last watermark
+
+    Returns:
+        tuple: (changed pets, deleted pet keys, new watermark)
+    """
+    started_at = datetime.utcnow()
+    since_iso = since.isoformat()
+
+    changed = query_all(
+        table,
+        IndexName='UpdatedAtIndex',
+        KeyConditionExpression=Key('record_type').eq('pet') & Key('updated_at').gte(since_iso)
+    )
+    tombstones = query_all(
+        tombstones_table,
+        KeyConditionExpression=Key('record_type').eq('pet') & Key('tombstone_id').gte(since_iso)
+    )
+    deleted = [dict(tombstone['key'], deleted_at=tombstone['deleted_at']) for tombstone in tombstones]
+
+    watermark = max(since_iso, (started_at - timedelta(seconds=sync_lag_seconds)).isoformat())
+    return changed, deleted, watermark
+
+
 def lambda_handler(event, context):
     """
     Lambda function handler to retrieve all pets from DynamoDB.
 
     This function is invoked by API Gateway when a GET request is made to /pets.
     It scans the Pets DynamoDB table and returns all pet records.
+    With `?changed_since=<ISO timestamp>` it only returns the pets that changed
+    since that watermark, plus tombstones for deleted ones.
 
     Args:
         event: API Gateway event object containing request details
@@ -45,6 +142,44 @@ def lambda_handler(event, context):
     }
 
     try:
+        query_params = event.get('queryStringParameters') or {}
+
+        # Serve only the changes since the client's watermark
+        if query_params.get('changed_since'):
+            try:
+                since = parse_changed_since(query_params['changed_since'])
+            except ValueError:
+                return {
+                    'statusCode': 400,
+                    'headers': headers,
+                    'body': json.dumps({
+                        'message': 'Bad request - changed_since must be an ISO 8601 timestamp'
+                    })
+                }
+
+            if since < datetime.utcnow() - timedelta(days=tombstone_retention_days):
+                return {
+                    'statusCode': 410,
+                    'headers': headers,
+                    'body': json.dumps({
+                        'message': 'changed_since is older than the tombstone retention - reload the full list'
+                    })
+                }
+
+            pets, deleted, watermark = get_changed_pets(since)
+
+            return {
+                'statusCode': 200,
+                'headers': headers,
+                'body': json.dumps({
+                    'message': 'Successfully got pet changes',
+                    'pets': strip_internal_attributes(pets),
+                    'deleted': deleted,
+                    'count': len(pets),
+                    'watermark': watermark
+                }, cls=DecimalEncoder)
+            }
+
         # Scan the DynamoDB table to get all pets
         response = table.scan()
         pets = response.get('Items', [])
@@ -61,7 +196,7 @@ def lambda_handler(event, context):
             'headers': headers,
             'body': json.dumps({
                 'message': 'Successfully got pets',
-                'pets': pets
+                'pets': strip_internal_attributes(pets)
             }, cls=DecimalEncoder)
         }
 
@@ -0,0 +1,113 @@
+import json
+import os
+import boto3
+from decimal import Decimal
+from botocore.exceptions import ClientError
+
+# Environment variables
+versions_table_name = os.environ.get('TABLE_VERSIONS_TABLE_NAME', 'TableVersions')
+region = os.environ.get('AWS_REGION', 'us-east-1')
+max_age_seconds = int(os.environ.get('VERSION_MAX_AGE_SECONDS', '10'))
+
+# Initialize DynamoDB resource
+dynamodb = boto3.resource('dynamodb', region_name=region)
+versions_table = dynamodb.Table(versions_table_name)
+
+# Tables whose versions are tracked in the TableVersions item
+tracked_tables = ['pets', 'applications', 'adoptions']
+
+
+def lambda_handler(event, context):
+    """
+    Lambda function handler to return the current version of each table.
+
+    This function is invoked by API Gateway when a GET request is made to /version.
+    It reads the single TableVersions item and returns a monotonically
+    increasing version and last-modified timestamp for pets, applications and
+    adoptions. Clients poll this endpoint and only re-fetch a list when its
+    version changes.
+
+    The response carries an ETag built from the versions and a Cache-Control
+    max-age, and a matching If-None-Match header returns 304 with no body.
+
+    Args:
+        event: API Gateway event object containing request details
+        context: Lambda context object with runtime information
+
+    Returns:
+        dict: API Gateway response with statusCode, headers, and body
+    """
+
+    # CORS headers for cross-origin requests
+    headers = {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,If-None-Match',
+        'Access-Control-Allow-Methods': 'GET,OPTIONS',
+        'Access-Control-Expose-Headers': 'ETag',
+        'Cache-Control': f'public, max-age={max_age_seconds}'
+    }
+
+    try:
+        # Read the single item holding every table's version
+        item = versions_table.get_item(Key={'id': 'tables'}).get('Item', {})
+
+        versions = {
+            key: {
+                'version': int(item.get(f'{key}_version', Decimal(0))),
+                'updated_at': item.get(f'{key}_updated_at')
+            }
+            for key in tracked_tables
+        }
+
+        etag = '"' + '-'.join(str(versions[key]['version']) for key in tracked_tables) + '"'
+        headers['ETag'] = etag
+
+        # Let clients skip the body entirely when nothing has changed
+        request_headers = {k.lower(): v for k, v in (event.get('headers') or {}).items()}
+        if request_headers.get('if-none-match') == etag:
+            return {
+                'statusCode': 304,
+                'headers': headers,
+                'body': ''
+            }
+
+        return {
+            'statusCode': 200,
+            'headers': headers,
+            'body': json.dumps({
+                'message': 'Successfully got table versions',
+                'versions': versions
+            })
+        }
+
+    except ClientError as e:
+        # Handle DynamoDB-specific errors
+        error_code = e.response['Error']['Code']
+        error_message = e.response['Error']['Message']
+
+        print(f"DynamoDB ClientError: {error_code} - {error_message}")
+
+        headers['Cache-Control'] = 'no-store'
+        return {
+            'statusCode': 500,
+            'headers': headers,
+            'body': json.dumps({
+                'message': 'Internal server error',
+                'error': f"{error_code}: {error_message}"
+            })
+        }
+
+    except Exception as e:
+        # Handle any other unexpected errors
+        print(f"Unexpected error: {str(e)}")
+
+        headers['Cache-Control'] = 'no-store'
+        return {
+            'statusCode': 500,
+            'headers': headers,
+            'body': json.dumps({
+                'message': 'Internal server error',
+                'error': str(e)
+            })
+        }
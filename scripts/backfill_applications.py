@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Script to backfill lifecycle and delta-sync attributes on existing applications.
+
+Applications created before TTL archival and delta sync were introduced have
+no `expires_at`, `record_type` or `updated_at`, so they never expire, are never
+archived and never show up in `?changed_since=` syncs. This script sets any
+missing attribute without touching the ones already present:
+
+- `expires_at` - `submitted_at` + APPLICATION_RETENTION_DAYS (default 180),
+  in epoch seconds. Applications already past their retention are deleted by
+  DynamoDB TTL within a few days and archived to S3 by archiveApplications.
+- `record_type` - "application"
+- `updated_at` - the time the script runs
+
+Usage:
+    APPLICATION_RETENTION_DAYS=180 python scripts/backfill_applications.py
+"""
+
+import os
+import time
+from datetime import datetime, timezone
+import boto3
+
+# Initialize DynamoDB resource
+dynamodb = boto3.resource('dynamodb')
+
+retention_days = int(os.environ.get('APPLICATION_RETENTION_DAYS', '180'))
+
+
+def backfill_applications():
+    """
+    Set expires_at, record_type and updated_at on applications missing them.
+    """
+    # Reference to the Applications table
+    table = dynamodb.Table('Applications')
+
+    now = datetime.utcnow().isoformat()
+    retention_seconds = retention_days * 24 * 60 * 60
+
+    print("Starting to backfill Applications table...")
+    updated = 0
+    skipped = 0
+
+    scan_kwargs = {
+        'ProjectionExpression': 'applicationId, submitted_at, expires_at, record_type, updated_at'
+    }
+    while True:
+        response = table.scan(**scan_kwargs)
+
+        for application in response.get('Items', []):
+            if all(attr in application for attr in ('expires_at', 'record_type', 'updated_at')):
+                skipped += 1
+                continue
+
+            # Retention runs from submission; fall back to now if submitted_at is unusable
+            try:
+                submitted_at = datetime.fromisoformat(application['submitted_at'])
+                if submitted_at.tzinfo is None:
+                    submitted_at = submitted_at.replace(tzinfo=timezone.utc)
+                expires_at = int(submitted_at.timestamp()) + retention_seconds
+            except (KeyError, ValueError):
+                expires_at = int(time.time()) + retention_seconds
+
+            try:
+                table.update_item(
+                    Key={'applicationId': application['applicationId']},
+                    UpdateExpression=(
+                        'SET expires_at = if_not_exists(expires_at, :expires_at), '
+                        'record_type = if_not_exists(record_type, :record_type), '
+                        'updated_at = if_not_exists(updated_at, :now)'
+                    ),
+                    ExpressionAttributeValues={
+                        ':expires_at': expires_at,
+                        ':record_type': 'application',
+                        ':now': now
+                    }
+                )
+                updated += 1
+                print(f"✓ Backfilled: {application['applicationId']}")
+            except Exception as e:
+                print(f"✗ Failed to backfill {application['applicationId']}: {str(e)}")
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    print("\nBackfill complete!")
+    print(f"Applications backfilled: {updated}")
+    print(f"Applications already up to date: {skipped}")
+
+
+if __name__ == '__main__':
+    # Run the backfill function when script is executed
+    backfill_applications()
@@ -8,6 +8,7 @@ Usage:
 """
 
 import boto3
+from datetime import datetime
 from decimal import Decimal
 
 # Initialize DynamoDB resource
@@ -111,8 +112,13 @@ def populate_dynamodb():
     ]
 
     # Insert each pet into the DynamoDB table
+    # record_type/updated_at are the keys of the UpdatedAtIndex GSI used by
+    # ?changed_since= delta syncs
+    updated_at = datetime.utcnow().isoformat()
     print("Starting to populate Pets table...")
     for pet in pets_data:
+        pet['record_type'] = 'pet'
+        pet['updated_at'] = updated_at
         try:
             table.put_item(Item=pet)
             print(f"✓ Added: {pet['name']} ({pet['species']}) - ID: {pet['id']}")